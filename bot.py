@@ -1,13 +1,20 @@
+import asyncio
+import heapq
 import logging
-from typing import Dict, List
-from datetime import datetime, timedelta, date
-import pytz
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+import math
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, date, timezone
+from telegram import Bot, Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.constants import MessageLimit
 from telegram.ext import (
-    Updater, CommandHandler, CallbackQueryHandler, 
-    CallbackContext, ConversationHandler, MessageHandler, Filters
+    Application, CommandHandler, CallbackQueryHandler,
+    ContextTypes, ConversationHandler, MessageHandler, filters
 )
 from rzd_api import RzdAPI  # Импорт нашего нового класса
+from storage import Storage
+from rate_limit import TokenBucket
 
 # Настройка логирования
 logging.basicConfig(
@@ -19,13 +26,38 @@ logger = logging.getLogger(__name__)
 # Состояния для ConversationHandler
 SELECT_STATION_FROM, SELECT_STATION_TO, SELECT_DATE, CONFIRM_SEARCH = range(4)
 
+# Шаблоны callback_data для inline-кнопок
+SEARCH_RE = re.compile(r'^(confirm|cancel)_search$')
+SUBSCRIBE_RE = re.compile(r'^subscribe_(\d+)$')
+
+# Ограничение числа одновременных запросов к РЖД при периодической проверке
+MAX_CONCURRENT_CHECKS = 8
+
 class RzdTicketBot:
     def __init__(self, token: str):
-        self.updater = Updater(token)
-        self.dispatcher = self.updater.dispatcher
+        self.token = token
+        self.application = (
+            Application.builder()
+            .token(token)
+            .post_shutdown(self._post_shutdown)
+            .build()
+        )
         self.user_searches: Dict[int, Dict] = {}
-        self.active_subscriptions: Dict[int, List[Dict]] = {}
+        self.storage = Storage()
+        # Очередь подписок по времени следующей проверки: (time.monotonic(), id подписки)
+        self._sub_heap: List[Tuple[float, int]] = []
+        self._subs_by_id: Dict[int, Dict] = {}
+        now = time.monotonic()
+        today = datetime.now().date()
+        # Подписки, дата которых прошла, пока бот был остановлен
+        self.storage.forget_past_tickets(today)
+        for sub in self.storage.get_active_subscriptions(today):
+            self._schedule(sub, now)
         self.rzd_api = RzdAPI()  # Создаем экземпляр нашего API
+        self._checks_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+        # Лимиты Telegram: ~30 сообщений в секунду всего и 1 в секунду на чат
+        self._send_bucket = TokenBucket(rate=25, per=1.0)
+        self._chat_buckets: Dict[int, TokenBucket] = {}
         
         self._register_handlers()
         
@@ -34,40 +66,40 @@ class RzdTicketBot:
             entry_points=[CommandHandler('search', self.search_start)],
             states={
                 SELECT_STATION_FROM: [
-                    MessageHandler(Filters.text & ~Filters.command, self.select_station_from)
+                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.select_station_from)
                 ],
                 SELECT_STATION_TO: [
-                    MessageHandler(Filters.text & ~Filters.command, self.select_station_to)
+                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.select_station_to)
                 ],
                 SELECT_DATE: [
-                    MessageHandler(Filters.text & ~Filters.command, self.select_date)
+                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.select_date)
                 ],
                 CONFIRM_SEARCH: [
-                    CallbackQueryHandler(self.confirm_search, pattern='^(confirm|cancel)_search$')
+                    CallbackQueryHandler(self.confirm_search, pattern=SEARCH_RE)
                 ],
             },
             fallbacks=[CommandHandler('cancel', self.cancel)],
         )
         
-        self.dispatcher.add_handler(CommandHandler("start", self.start))
-        self.dispatcher.add_handler(CommandHandler("help", self.help))
-        self.dispatcher.add_handler(CommandHandler("subscriptions", self.show_subscriptions))
-        self.dispatcher.add_handler(CallbackQueryHandler(self.subscribe, pattern='^subscribe_'))
-        self.dispatcher.add_handler(conv_handler)
-        self.dispatcher.add_error_handler(self.error_handler)
+        self.application.add_handler(CommandHandler("start", self.start))
+        self.application.add_handler(CommandHandler("help", self.help))
+        self.application.add_handler(CommandHandler("subscriptions", self.show_subscriptions))
+        self.application.add_handler(CallbackQueryHandler(self.subscribe, pattern=SUBSCRIBE_RE))
+        self.application.add_handler(conv_handler)
+        self.application.add_error_handler(self.error_handler)
 
-    def start(self, update: Update, context: CallbackContext) -> None:
+    async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Обработка команды /start"""
         user = update.effective_user
-        update.message.reply_text(
+        await update.message.reply_text(
             f"Привет, {user.first_name}!\n"
             "Я бот для отслеживания железнодорожных билетов РЖД.\n"
             "Используй /search для поиска билетов или /help для справки."
         )
     
-    def help(self, update: Update, context: CallbackContext) -> None:
+    async def help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Обработка команды /help"""
-        update.message.reply_text(
+        await update.message.reply_text(
             "Доступные команды:\n"
             "/start - начать работу с ботом\n"
             "/search - поиск билетов\n"
@@ -76,83 +108,139 @@ class RzdTicketBot:
             "Бот может уведомлять вас о появлении билетов на выбранные направления."
         )
 
-    def search_start(self, update: Update, context: CallbackContext) -> int:
+    async def search_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Начало поиска - запрос станции отправления"""
-        update.message.reply_text(
+        await update.message.reply_text(
             "Введите станцию отправления (например: Москва):"
         )
         return SELECT_STATION_FROM
     
-    def show_subscriptions(self, update: Update, context: CallbackContext) -> None:
+    async def show_subscriptions(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Показ активных подписок пользователя"""
         user_id = update.effective_user.id
-        if user_id not in self.active_subscriptions or not self.active_subscriptions[user_id]:
-            update.message.reply_text("У вас нет активных подписок.")
+        subscriptions = self.storage.get_user_subscriptions(user_id)
+        if not subscriptions:
+            await update.message.reply_text("У вас нет активных подписок.")
             return
         
-        response = "Ваши активные подписки:\n\n"
-        for sub in self.active_subscriptions[user_id]:
-            response += (
+        parts = ["Ваши активные подписки:\n\n"]
+        for sub in subscriptions:
+            parts.append(
                 f"Маршрут: {sub['from']['name']} → {sub['to']['name']}\n"
-                f"Дата: {sub['date']}\n"
+                f"Дата: {sub['date'].strftime('%d.%m.%Y')}\n"
                 f"Последняя проверка: {sub['last_check'].strftime('%d.%m.%Y %H:%M')}\n\n"
             )
         
-        update.message.reply_text(response)
+        await update.message.reply_text("".join(parts))
 
-    def check_tickets_periodically(self, context: CallbackContext) -> None:
-        """Периодическая проверка билетов для активных подписок"""
-        for user_id, subscriptions in self.active_subscriptions.items():
-            for sub in subscriptions:
-                try:
-                    # Получаем актуальные билеты через наш экземпляр API
-                    tickets = self.rzd_api.get_tickets(
-                        from_code=sub['from']['code'],
-                        to_code=sub['to']['code'],
-                        date=datetime.strptime(sub['date'], "%d.%m.%Y")
-                    )
+    def _schedule(self, sub: Dict, next_check: float) -> None:
+        """Постановка подписки в очередь проверок"""
+        self._subs_by_id[sub['id']] = sub
+        heapq.heappush(self._sub_heap, (next_check, sub['id']))
+
+    def _check_interval(self, sub: Dict, today: date) -> int:
+        """Интервал между проверками в секундах: чем ближе поездка, тем чаще"""
+        days_left = (sub['date'] - today).days
+        if days_left <= 1:
+            return 600  # 10 минут
+        if days_left <= 30:
+            return 1800  # 30 минут
+        return 3600  # 1 час
 
-                    search_date = datetime.strptime(sub['date'], "%d.%m.%Y").date()
-                    if search_date < datetime.now().date():
-                        continue
+    async def check_tickets_periodically(self, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Периодическая проверка билетов для подписок, у которых подошло время"""
+        now = time.monotonic()
+        today = datetime.now().date()
+        
+        due = []
+        while self._sub_heap and self._sub_heap[0][0] <= now:
+            _, sub_id = heapq.heappop(self._sub_heap)
+            sub = self._subs_by_id[sub_id]
+            if sub['date'] < today:
+                # Поездка уже прошла, подписка больше не проверяется
+                del self._subs_by_id[sub_id]
+                self.storage.forget_known_tickets(sub_id)
+                continue
+            due.append(sub)
+        
+        # Подписки проверяются параллельно, не более MAX_CONCURRENT_CHECKS одновременно
+        await asyncio.gather(
+            *(self._check_subscription(context, sub) for sub in due)
+        )
+        
+        now = time.monotonic()
+        for sub in due:
+            self._schedule(sub, now + self._check_interval(sub, today))
 
-                    if tickets is None:
-                        continue
-                    
-                    # Сравниваем с предыдущими результатами
-                    new_tickets = self._find_new_tickets(sub['tickets'], tickets)
-                    
-                    if new_tickets:
-                        # Отправляем уведомление о новых билетах
-                        message = "🚀 Появились новые билеты:\n\n"
-                        for ticket in new_tickets:
-                            message += (
-                                f"🚂 Поезд: {ticket.get('number', 'N/A')}\n"
-                                f"🕒 Отправление: {ticket.get('departure', 'N/A')}\n"
-                                f"🕓 Прибытие: {ticket.get('arrival', 'N/A')}\n"
-                                f"💰 Цена: {self._format_price(ticket.get('seats', []))}\n"
-                                f"💺 Места: {self._format_seats(ticket.get('seats', []))}\n\n"
-                            )
-                        
-                        context.bot.send_message(
-                            chat_id=user_id,
-                            text=message
-                        )
-                    
-                    # Обновляем данные подписки
-                    sub['tickets'] = tickets
-                    sub['last_check'] = datetime.now(pytz.utc)
-                    
-                except Exception as e:
-                    logger.error(f"Ошибка при проверке билетов для пользователя {user_id}: {e}")
+    async def _check_subscription(self, context: ContextTypes.DEFAULT_TYPE, sub: Dict) -> None:
+        """Проверка одной подписки и уведомление о новых билетах"""
+        user_id = sub['user_id']
+        try:
+            async with self._checks_semaphore:
+                # Получаем актуальные билеты через наш экземпляр API
+                tickets = await self.rzd_api.get_tickets(
+                    from_code=sub['from']['code'],
+                    to_code=sub['to']['code'],
+                    date=sub['date']
+                )
 
+            # Ошибка запроса: сохраненные билеты не трогаем, иначе при следующей
+            # успешной проверке все поезда окажутся "новыми"
+            if tickets is None:
+                return
+            
+            # Сравниваем с предыдущими результатами
+            new_tickets = self.storage.find_new_tickets(sub['id'], tickets)
+            
+            if new_tickets:
+                # Отправляем уведомление о новых билетах
+                parts = ["🚀 Появились новые билеты:\n\n"]
+                for ticket in new_tickets:
+                    parts.append(
+                        f"🚂 Поезд: {ticket.get('number', 'N/A')}\n"
+                        f"🕒 Отправление: {ticket.get('departure', 'N/A')}\n"
+                        f"🕓 Прибытие: {ticket.get('arrival', 'N/A')}\n"
+                        f"💰 Цена: {self._format_price(ticket.get('seats', []))}\n"
+                        f"💺 Места: {self._format_seats(ticket.get('seats', []))}\n\n"
+                    )
+                
+                await self._send_message(context.bot, user_id, "".join(parts))
+            
+            # Обновляем данные подписки
+            self.storage.set_known_tickets(sub['id'], tickets)
+            self.storage.update_last_check(sub['id'], datetime.now(timezone.utc))
+            
+        except Exception as e:
+            logger.error(f"Ошибка при проверке билетов для пользователя {user_id}: {e}")
     
-    def _find_new_tickets(self, old_tickets: List[Dict], new_tickets: List[Dict]) -> List[Dict]:
-        """Поиск новых билетов по сравнению с предыдущей проверкой"""
-        old_numbers = {t.get('number') for t in old_tickets if t.get('number')}
-        return [t for t in new_tickets if t.get('number') not in old_numbers]
+    async def _send_message(self, bot: Bot, chat_id: int, text: str) -> None:
+        """Отправка уведомления с соблюдением лимитов Telegram"""
+        # Восстановившиеся бакеты не отличаются от новых, хранить их незачем
+        for full_chat_id in [c for c, b in self._chat_buckets.items() if b.is_full()]:
+            del self._chat_buckets[full_chat_id]
+        
+        chat_bucket = self._chat_buckets.get(chat_id)
+        if chat_bucket is None:
+            chat_bucket = self._chat_buckets[chat_id] = TokenBucket(rate=1, per=1.0)
+        
+        for chunk in self._split_message(text):
+            await chat_bucket.acquire()
+            await self._send_bucket.acquire()
+            await bot.send_message(chat_id=chat_id, text=chunk)
+
+    def _split_message(self, text: str) -> List[str]:
+        """Разбиение длинного текста на части по границам блоков"""
+        chunks = []
+        while len(text) > MessageLimit.MAX_TEXT_LENGTH:
+            cut = text.rfind("\n\n", 0, MessageLimit.MAX_TEXT_LENGTH)
+            if cut <= 0:
+                cut = MessageLimit.MAX_TEXT_LENGTH
+            chunks.append(text[:cut])
+            text = text[cut:].lstrip("\n")
+        chunks.append(text)
+        return chunks
     
-    def select_date(self, update: Update, context: CallbackContext) -> int:
+    async def select_date(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Обработка выбора даты"""
         date_str = update.message.text
         try:
@@ -160,10 +248,10 @@ class RzdTicketBot:
             if date < datetime.now().date():
                 raise ValueError("Дата в прошлом")
         except ValueError as e:
-            update.message.reply_text("Некорректная дата. Введите дату в формате ДД.ММ.ГГГГ:")
+            await update.message.reply_text("Некорректная дата. Введите дату в формате ДД.ММ.ГГГГ:")
             return SELECT_DATE
         
-        context.user_data['date'] = date_str
+        context.user_data['date'] = date
         
         # Формируем подтверждение поиска
         station_from = context.user_data['station_from']
@@ -177,7 +265,7 @@ class RzdTicketBot:
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        update.message.reply_text(
+        await update.message.reply_text(
             f"Параметры поиска:\n"
             f"Отправление: {station_from['name']}\n"
             f"Прибытие: {station_to['name']}\n"
@@ -187,13 +275,13 @@ class RzdTicketBot:
         )
         return CONFIRM_SEARCH
 
-    def select_station_from(self, update: Update, context: CallbackContext) -> int:
+    async def select_station_from(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Обработка выбора станции отправления с использованием нашего API"""
         query = update.message.text
-        stations = self.rzd_api.station_by_name(query)
+        stations = await self.rzd_api.station_by_name(query)
         
         if not stations:
-            update.message.reply_text("🚂 Станции не найдены. Попробуйте еще раз:")
+            await update.message.reply_text("🚂 Станции не найдены. Попробуйте еще раз:")
             return SELECT_STATION_FROM
         
         context.user_data['station_from'] = {
@@ -201,19 +289,19 @@ class RzdTicketBot:
             'name': stations[0]['name']
         }
         
-        update.message.reply_text(
+        await update.message.reply_text(
             f"📍 Выбрана станция: {stations[0]['name']}\n"
             "Теперь введите станцию назначения:"
         )
         return SELECT_STATION_TO
 
-    def select_station_to(self, update: Update, context: CallbackContext) -> int:
+    async def select_station_to(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Обработка выбора станции назначения"""
         query = update.message.text
-        stations = self.rzd_api.station_by_name(query)
+        stations = await self.rzd_api.station_by_name(query)
         
         if not stations:
-            update.message.reply_text("🚂 Станции не найдены. Попробуйте еще раз:")
+            await update.message.reply_text("🚂 Станции не найдены. Попробуйте еще раз:")
             return SELECT_STATION_TO
         
         context.user_data['station_to'] = {
@@ -221,38 +309,44 @@ class RzdTicketBot:
             'name': stations[0]['name']
         }
         
-        update.message.reply_text(
+        await update.message.reply_text(
             f"📍 Выбрана станция: {stations[0]['name']}\n"
             "Теперь введите дату поездки в формате ДД.ММ.ГГГГ:"
         )
         return SELECT_DATE
 
-    def confirm_search(self, update: Update, context: CallbackContext) -> int:
+    async def confirm_search(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Подтверждение поиска с использованием нашего API"""
         query = update.callback_query
-        query.answer()
+        await query.answer()
         
         if query.data == 'cancel_search':
-            query.edit_message_text("❌ Поиск отменен")
+            await query.edit_message_text("❌ Поиск отменен")
             return ConversationHandler.END
         
         user_id = update.effective_user.id
         search_params = context.user_data
         
+        search_date = search_params['date']
+        
         try:
             # Используем наш метод get_tickets вместо tickets
-            tickets = self.rzd_api.get_tickets(
+            tickets = await self.rzd_api.get_tickets(
                 from_code=search_params['station_from']['code'],
                 to_code=search_params['station_to']['code'],
-                date=datetime.strptime(search_params['date'], "%d.%m.%Y")
+                date=search_date
             )
         except Exception as e:
             logger.error(f"Ошибка при поиске билетов: {e}")
-            query.edit_message_text("⚠️ Произошла ошибка при поиске билетов. Попробуйте позже.")
+            await query.edit_message_text("⚠️ Произошла ошибка при поиске билетов. Попробуйте позже.")
+            return ConversationHandler.END
+        
+        if tickets is None:
+            await query.edit_message_text("⚠️ Произошла ошибка при поиске билетов. Попробуйте позже.")
             return ConversationHandler.END
         
         if not tickets:
-            query.edit_message_text("😞 Билеты не найдены.")
+            await query.edit_message_text("😞 Билеты не найдены.")
             return ConversationHandler.END
         
         # Сохраняем поиск
@@ -262,17 +356,17 @@ class RzdTicketBot:
         search_data = {
             'from': search_params['station_from'],
             'to': search_params['station_to'],
-            'date': search_params['date'],
-            'last_check': datetime.now(pytz.utc),
+            'date': search_date,
+            'last_check': datetime.now(timezone.utc),
             'tickets': tickets
         }
         
         self.user_searches[user_id].append(search_data)
         
         # Формируем ответ
-        response = "🎫 Найденные билеты:\n\n"
+        parts = ["🎫 Найденные билеты:\n\n"]
         for ticket in tickets[:5]:  # Показываем первые 5 вариантов
-            response += (
+            parts.append(
                 f"🚂 Поезд: {ticket.get('number', 'N/A')}\n"
                 f"🕒 Отправление: {ticket.get('departure', 'N/A')}\n"
                 f"🕓 Прибытие: {ticket.get('arrival', 'N/A')}\n"
@@ -280,7 +374,7 @@ class RzdTicketBot:
                 f"💺 Места: {self._format_seats(ticket.get('seats', []))}\n\n"
             )
         
-        query.edit_message_text(response)
+        await query.edit_message_text("".join(parts))
         
         # Предлагаем подписаться
         keyboard = [[
@@ -288,7 +382,7 @@ class RzdTicketBot:
                 "🔔 Подписаться на обновления", 
                 callback_data=f"subscribe_{len(self.user_searches[user_id])-1}")
         ]]
-        update.message.reply_text(
+        await query.message.reply_text(
             "Хотите получать уведомления о новых билетах?",
             reply_markup=InlineKeyboardMarkup(keyboard)
         )
@@ -300,11 +394,17 @@ class RzdTicketBot:
         if not seats:
             return "не указана"
         
-        prices = [float(s.get('price')) for s in seats if s.get('price')]
-        if not prices:
+        min_price = math.inf
+        for seat in seats:
+            price = seat.get('price')
+            if price:
+                value = float(price)
+                if value < min_price:
+                    min_price = value
+        
+        if min_price == math.inf:
             return "не указана"
         
-        min_price = min(prices)
         return f"от {min_price} руб."
 
     def _format_seats(self, seats: List[Dict]) -> str:
@@ -315,45 +415,64 @@ class RzdTicketBot:
         free_seats = sum(int(s.get('free', 0)) for s in seats)
         return f"{free_seats} свободных" if free_seats > 0 else "нет мест"
     
-    def cancel(self, update: Update, context: CallbackContext) -> int:
+    async def cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Отмена текущего действия"""
-        update.message.reply_text('Действие отменено.')
+        await update.message.reply_text('Действие отменено.')
         return ConversationHandler.END
     
-    def error_handler(self, update: Update, context: CallbackContext) -> None:
+    async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Обработка ошибок"""
         logger.error(msg="Исключение при обработке обновления:", exc_info=context.error)
         
         if update and update.effective_message:
-            update.effective_message.reply_text(
+            await update.effective_message.reply_text(
                 "Произошла ошибка. Пожалуйста, попробуйте позже или обратитесь в поддержку."
             )
 
-    def subscribe(self, update: Update, context: CallbackContext) -> None:
+    async def subscribe(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         query = update.callback_query
-        query.answer()
+        await query.answer()
         
         user_id = update.effective_user.id
-        search_idx = int(query.data.split('_')[1])
-        
-        if user_id not in self.active_subscriptions:
-            self.active_subscriptions[user_id] = []
+        # Совпадение с SUBSCRIBE_RE уже найдено обработчиком
+        search_idx = int(context.match.group(1))
         
         search_data = self.user_searches[user_id][search_idx]
-        self.active_subscriptions[user_id].append(search_data)
+        sub_id = self.storage.add_subscription(user_id, search_data)
+        
+        # Билеты только что получены, первая проверка - через обычный интервал
+        sub = self.storage.get_subscription(sub_id)
+        self._schedule(sub, time.monotonic() + self._check_interval(sub, datetime.now().date()))
         
-        query.edit_message_text("✅ Вы подписались на обновления по этому маршруту!")
+        await query.edit_message_text("✅ Вы подписались на обновления по этому маршруту!")
+
+    async def _post_shutdown(self, application: Application) -> None:
+        """Освобождение ресурсов при остановке бота"""
+        await self.rzd_api.close()
+        self.storage.close()
 
-    def run(self):
-        """Запуск бота с периодической проверкой"""
-        job_queue = self.updater.job_queue
+    def run(self, webhook_host: Optional[str] = None, port: int = 8443):
+        """Запуск бота с периодической проверкой
+        
+        Если задан webhook_host, обновления принимаются через вебхук,
+        иначе используется long polling.
+        """
+        job_queue = self.application.job_queue
         job_queue.run_repeating(
             self.check_tickets_periodically, 
-            interval=1800,  # 30 минут
+            interval=60,  # проверяются только подписки, у которых подошло время
             first=10
         )
-        self.updater.start_polling()
-        self.updater.idle()
+        if webhook_host:
+            self.application.run_webhook(
+                listen="0.0.0.0",
+                port=port,
+                url_path=self.token,
+                webhook_url=f"https://{webhook_host}/{self.token}"
+            )
+        else:
+            # Telegram держит соединение до 30 секунд, пока не появятся обновления
+            self.application.run_polling(timeout=30)
 
 
 if __name__ == '__main__':
@@ -367,4 +486,4 @@ if __name__ == '__main__':
         raise ValueError("Не задан BOT_TOKEN в .env файле")
     
     bot = RzdTicketBot(BOT_TOKEN)
-    bot.run()
\ No newline at end of file
+    bot.run(webhook_host=os.getenv('HOST'), port=int(os.getenv('PORT', 8443)))
\ No newline at end of file
@@ -0,0 +1,35 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Ограничитель частоты запросов по алгоритму token bucket"""
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def is_full(self) -> bool:
+        """Бакет полностью восстановился и ничем не отличается от нового"""
+        if self._lock.locked():
+            return False
+        elapsed = time.monotonic() - self._updated
+        return self._tokens + elapsed * self.rate / self.per >= self.rate
+
+    async def acquire(self) -> None:
+        """Получение одного токена, при необходимости с ожиданием"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.per)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
@@ -1,6 +1,60 @@
-import requests
-from datetime import datetime
-import json
+import asyncio
+import httpx
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Union
+import orjson
+
+
+class TTLCache:
+    """Потокобезопасный LRU-кэш с ограниченным временем жизни записей"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Возвращает значение по ключу или None, если записи нет или она устарела"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        """Сохраняет значение, вытесняя самую старую запись при переполнении"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class SingleFlight:
+    """Объединение одновременных одинаковых запросов в один"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable]):
+        """Выполняет func, либо дожидается уже запущенного вызова с тем же ключом"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Отмена одного из ожидающих не должна прерывать запрос для остальных
+        return await asyncio.shield(future)
+
 
 class RzdAPI:
     """Python реализация API РЖД"""
@@ -8,15 +62,41 @@ class RzdAPI:
     BASE_URL = "https://pass.rzd.ru/"
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        })
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept': 'application/json'
+            }
+        )
+        # Названия станций меняются редко, расписание - часто
+        self._stations_cache = TTLCache(maxsize=2048, ttl=3600)
+        self._timetable_cache = TTLCache(maxsize=2048, ttl=60)
+        self._inflight = SingleFlight()
     
-    def station_by_name(self, name: str) -> list:
+    async def close(self) -> None:
+        """Закрытие пула соединений"""
+        await self._client.aclose()
+    
+    async def station_by_name(self, name: str) -> list:
         """Поиск станций по названию"""
-        url = f"{self.BASE_URL}suggester"
+        return await self._station_by_name_cached(name.strip().lower())
+    
+    async def _station_by_name_cached(self, name: str) -> list:
+        """Поиск станций по нормализованному названию с кэшированием"""
+        cached = self._stations_cache.get(name)
+        if cached is not None:
+            return cached
+        
+        return await self._inflight.do(
+            ('suggester', name),
+            lambda: self._fetch_stations(name)
+        )
+    
+    async def _fetch_stations(self, name: str) -> list:
+        url = "suggester"
         params = {
             'stationNamePart': name,
             'lang': 'ru',
@@ -24,16 +104,31 @@ class RzdAPI:
         }
         
         try:
-            response = self.session.get(url, params=params)
+            response = await self._client.get(url, params=params)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            stations = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             print(f"Ошибка поиска станции: {e}")
             return []
+        
+        self._stations_cache.set(name, stations)
+        return stations
     
-    def get_timetable(self, from_code: str, to_code: str, date: datetime) -> dict:
+    async def get_timetable(self, from_code: str, to_code: str, date: Union[date, datetime]) -> dict:
         """Получение расписания между станциями"""
-        url = f"{self.BASE_URL}timetable/public/"
+        cache_key = (from_code, to_code, date.strftime('%Y-%m-%d'))
+        cached = self._timetable_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        return await self._inflight.do(
+            ('timetable',) + cache_key,
+            lambda: self._fetch_timetable(from_code, to_code, date, cache_key)
+        )
+    
+    async def _fetch_timetable(self, from_code: str, to_code: str,
+                               date: Union[date, datetime], cache_key: tuple) -> dict:
+        url = "timetable/public/"
         params = {
             'layer_id': 5827,
             'dir': 0,
@@ -45,18 +140,26 @@ class RzdAPI:
         }
         
         try:
-            response = self.session.get(url, params=params)
+            response = await self._client.get(url, params=params)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            timetable = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             print(f"Ошибка получения расписания: {e}")
             return {}
+        
+        self._timetable_cache.set(cache_key, timetable)
+        return timetable
     
-    def get_tickets(self, from_code: str, to_code: str, date: datetime) -> list:
-        """Получение списка билетов"""
-        timetable = self.get_timetable(from_code, to_code, date)
+    async def get_tickets(self, from_code: str, to_code: str,
+                          date: Union[date, datetime]) -> Optional[list]:
+        """Получение списка билетов
+        
+        Возвращает None, если расписание получить не удалось, и пустой
+        список, если поездов с местами нет.
+        """
+        timetable = await self.get_timetable(from_code, to_code, date)
         if not timetable:
-            return []
+            return None
         
         # Парсинг результатов (адаптируйте под актуальную структуру ответа)
         trains = timetable.get('tp', [])
@@ -0,0 +1,163 @@
+import sqlite3
+from datetime import date, datetime
+from typing import Dict, List, Set
+
+
+class Storage:
+    """Хранилище подписок и известных билетов в SQLite"""
+
+    def __init__(self, path: str = "bot.db"):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # Номера известных поездов по подпискам, подгружаются из базы один раз
+        self._known_numbers: Dict[int, Set[str]] = {}
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        """Создание таблиц и индексов при первом запуске"""
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS subscriptions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    from_code TEXT NOT NULL,
+                    from_name TEXT NOT NULL,
+                    to_code TEXT NOT NULL,
+                    to_name TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    last_check TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS known_tickets (
+                    sub_id INTEGER NOT NULL REFERENCES subscriptions(id),
+                    train_number TEXT NOT NULL,
+                    PRIMARY KEY (sub_id, train_number)
+                );
+                CREATE INDEX IF NOT EXISTS idx_subs_date ON subscriptions(date);
+                CREATE INDEX IF NOT EXISTS idx_subs_user ON subscriptions(user_id);
+            """)
+
+    def close(self) -> None:
+        """Закрытие соединения с базой"""
+        self._conn.close()
+
+    def add_subscription(self, user_id: int, search_data: Dict) -> int:
+        """Сохранение подписки вместе с уже найденными билетами"""
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO subscriptions "
+                "(user_id, from_code, from_name, to_code, to_name, date, last_check) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    user_id,
+                    search_data['from']['code'],
+                    search_data['from']['name'],
+                    search_data['to']['code'],
+                    search_data['to']['name'],
+                    search_data['date'].isoformat(),
+                    search_data['last_check'].isoformat(),
+                )
+            )
+            sub_id = cursor.lastrowid
+        self.set_known_tickets(sub_id, search_data['tickets'])
+        return sub_id
+
+    def get_subscription(self, sub_id: int) -> Dict:
+        """Подписка по идентификатору"""
+        row = self._conn.execute(
+            "SELECT * FROM subscriptions WHERE id = ?",
+            (sub_id,)
+        ).fetchone()
+        return self._row_to_sub(row)
+
+    def get_user_subscriptions(self, user_id: int) -> List[Dict]:
+        """Все подписки пользователя"""
+        rows = self._conn.execute(
+            "SELECT * FROM subscriptions WHERE user_id = ? ORDER BY id",
+            (user_id,)
+        )
+        return [self._row_to_sub(row) for row in rows]
+
+    def get_active_subscriptions(self, today: date) -> List[Dict]:
+        """Подписки, дата поездки которых еще не прошла"""
+        rows = self._conn.execute(
+            "SELECT * FROM subscriptions WHERE date >= ? ORDER BY id",
+            (today.isoformat(),)
+        )
+        return [self._row_to_sub(row) for row in rows]
+
+    def find_new_tickets(self, sub_id: int, tickets: List[Dict]) -> List[Dict]:
+        """Билеты, которых не было при предыдущей проверке подписки"""
+        known = self._get_known_numbers(sub_id)
+        return [t for t in tickets if t.get('number') and t['number'] not in known]
+
+    def set_known_tickets(self, sub_id: int, tickets: List[Dict]) -> None:
+        """Замена сохраненных билетов подписки результатами текущей проверки"""
+        numbers = [t['number'] for t in tickets if t.get('number')]
+
+        with self._conn:
+            # Поезда, которых больше нет в выдаче (например, места закончились),
+            # забываются, чтобы при их возвращении пришло уведомление
+            if numbers:
+                placeholders = ", ".join("?" * len(numbers))
+                self._conn.execute(
+                    f"DELETE FROM known_tickets "
+                    f"WHERE sub_id = ? AND train_number NOT IN ({placeholders})",
+                    (sub_id, *numbers)
+                )
+            else:
+                self._conn.execute(
+                    "DELETE FROM known_tickets WHERE sub_id = ?",
+                    (sub_id,)
+                )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO known_tickets (sub_id, train_number) VALUES (?, ?)",
+                [(sub_id, number) for number in numbers]
+            )
+        self._known_numbers[sub_id] = set(numbers)
+
+    def forget_known_tickets(self, sub_id: int) -> None:
+        """Удаление билетов подписки, которая больше не проверяется"""
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM known_tickets WHERE sub_id = ?",
+                (sub_id,)
+            )
+        self._known_numbers.pop(sub_id, None)
+
+    def forget_past_tickets(self, today: date) -> None:
+        """Удаление билетов подписок на уже прошедшие даты"""
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM known_tickets WHERE sub_id IN "
+                "(SELECT id FROM subscriptions WHERE date < ?)",
+                (today.isoformat(),)
+            )
+
+    def _get_known_numbers(self, sub_id: int) -> Set[str]:
+        known = self._known_numbers.get(sub_id)
+        if known is None:
+            rows = self._conn.execute(
+                "SELECT train_number FROM known_tickets WHERE sub_id = ?",
+                (sub_id,)
+            )
+            known = self._known_numbers[sub_id] = {row['train_number'] for row in rows}
+        return known
+
+    def update_last_check(self, sub_id: int, checked_at: datetime) -> None:
+        """Обновление времени последней проверки"""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE subscriptions SET last_check = ? WHERE id = ?",
+                (checked_at.isoformat(), sub_id)
+            )
+
+    @staticmethod
+    def _row_to_sub(row: sqlite3.Row) -> Dict:
+        return {
+            'id': row['id'],
+            'user_id': row['user_id'],
+            'from': {'code': row['from_code'], 'name': row['from_name']},
+            'to': {'code': row['to_code'], 'name': row['to_name']},
+            'date': date.fromisoformat(row['date']),
+            'last_check': datetime.fromisoformat(row['last_check']),
+        }